@@ -2,11 +2,15 @@ package matchspec
 
 import (
 	"encoding/json"
+	"errors"
 	"net/http"
 
 	"github.com/greynewell/mist-go/protocol"
 )
 
+// maxBodyBytes caps the size of request bodies accepted by the POST handlers.
+const maxBodyBytes = 1 << 20
+
 // Handler provides HTTP handlers for the MatchSpec API.
 type Handler struct {
 	runner   *Runner
@@ -27,8 +31,8 @@ func (h *Handler) Ingest(w http.ResponseWriter, r *http.Request) {
 	}
 
 	var msg protocol.Message
-	if err := json.NewDecoder(r.Body).Decode(&msg); err != nil {
-		http.Error(w, "invalid message: "+err.Error(), http.StatusBadRequest)
+	if err := json.NewDecoder(http.MaxBytesReader(w, r.Body, maxBodyBytes)).Decode(&msg); err != nil {
+		http.Error(w, "invalid message: "+err.Error(), decodeStatus(err))
 		return
 	}
 
@@ -61,8 +65,8 @@ func (h *Handler) RunDirect(w http.ResponseWriter, r *http.Request) {
 	}
 
 	var run protocol.EvalRun
-	if err := json.NewDecoder(r.Body).Decode(&run); err != nil {
-		http.Error(w, "invalid request: "+err.Error(), http.StatusBadRequest)
+	if err := json.NewDecoder(http.MaxBytesReader(w, r.Body, maxBodyBytes)).Decode(&run); err != nil {
+		http.Error(w, "invalid request: "+err.Error(), decodeStatus(err))
 		return
 	}
 
@@ -76,6 +80,15 @@ func (h *Handler) RunDirect(w http.ResponseWriter, r *http.Request) {
 	json.NewEncoder(w).Encode(results)
 }
 
+// decodeStatus maps a request body decode error to an HTTP status code.
+func decodeStatus(err error) int {
+	var tooLarge *http.MaxBytesError
+	if errors.As(err, &tooLarge) {
+		return http.StatusRequestEntityTooLarge
+	}
+	return http.StatusBadRequest
+}
+
 // SuitesResponse is the JSON body for GET /suites.
 type SuitesResponse struct {
 	Suites []SuiteInfo `json:"suites"`
@@ -90,14 +103,12 @@ type SuiteInfo struct {
 // Suites handles GET /suites — lists all registered suites.
 func (h *Handler) Suites(w http.ResponseWriter, r *http.Request) {
 	var resp SuitesResponse
-	for _, name := range h.registry.Names() {
-		if s, ok := h.registry.Get(name); ok {
-			resp.Suites = append(resp.Suites, SuiteInfo{
-				Name:      s.Name,
-				TaskCount: len(s.Tasks),
-			})
-		}
-	}
+	h.registry.Each(func(s *Suite) {
+		resp.Suites = append(resp.Suites, SuiteInfo{
+			Name:      s.Name,
+			TaskCount: len(s.Tasks),
+		})
+	})
 	w.Header().Set("Content-Type", "application/json")
 	json.NewEncoder(w).Encode(resp)
 }
@@ -7,7 +7,11 @@ import (
 	"fmt"
 	"net/http"
 	"net/http/httptest"
+	"strings"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/greynewell/mist-go/protocol"
 	"github.com/greynewell/mist-go/tokentrace"
@@ -126,6 +130,18 @@ func TestSuiteRegistryNames(t *testing.T) {
 	}
 }
 
+func TestSuiteRegistryEach(t *testing.T) {
+	reg := NewSuiteRegistry()
+	reg.Register(&Suite{Name: "a", Tasks: []Task{{Name: "t", Prompt: "p"}}})
+	reg.Register(&Suite{Name: "b", Tasks: []Task{{Name: "t", Prompt: "p"}}})
+
+	seen := make(map[string]bool)
+	reg.Each(func(s *Suite) { seen[s.Name] = true })
+	if len(seen) != 2 || !seen["a"] || !seen["b"] {
+		t.Errorf("Each visited %v, want a and b", seen)
+	}
+}
+
 func TestSuiteRegistryRejectInvalid(t *testing.T) {
 	reg := NewSuiteRegistry()
 	err := reg.Register(&Suite{Name: ""})
@@ -224,6 +240,60 @@ func TestRunnerRunInferError(t *testing.T) {
 	}
 }
 
+func TestRunnerRunConcurrent(t *testing.T) {
+	const limit = 3
+	var inFlight, peak int32
+	// Each call blocks until limit calls are in flight at once, so the run
+	// only passes if tasks actually execute in parallel.
+	full := make(chan struct{})
+	var once sync.Once
+	infer := func(ctx context.Context, prompt string) (string, error) {
+		n := atomic.AddInt32(&inFlight, 1)
+		defer atomic.AddInt32(&inFlight, -1)
+		for {
+			p := atomic.LoadInt32(&peak)
+			if n <= p || atomic.CompareAndSwapInt32(&peak, p, n) {
+				break
+			}
+		}
+		if n == limit {
+			once.Do(func() { close(full) })
+		}
+		select {
+		case <-full:
+		case <-time.After(2 * time.Second):
+			return "", fmt.Errorf("only %d tasks in flight, want %d", n, limit)
+		}
+		return echoInfer(ctx, prompt)
+	}
+
+	reg := NewSuiteRegistry()
+	var tasks []Task
+	for i := 0; i < 8; i++ {
+		name := fmt.Sprintf("t%d", i)
+		tasks = append(tasks, Task{Name: name, Prompt: name, Expected: "echo: " + name, Matcher: "exact"})
+	}
+	reg.Register(&Suite{Name: "wide", Tasks: tasks})
+	runner := NewRunner(reg, infer, tokentrace.NewReporter("matchspec", ""))
+	runner.SetConcurrency(limit)
+
+	results, err := runner.Run(context.Background(), protocol.EvalRun{Suite: "wide"})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(results) != len(tasks) {
+		t.Fatalf("expected %d results, got %d", len(tasks), len(results))
+	}
+	for i, r := range results {
+		if r.Task != tasks[i].Name || !r.Passed {
+			t.Errorf("results[%d] = %s passed=%v error=%q, want %s passed", i, r.Task, r.Passed, r.Error, tasks[i].Name)
+		}
+	}
+	if p := atomic.LoadInt32(&peak); p != limit {
+		t.Errorf("peak concurrency = %d, want %d", p, limit)
+	}
+}
+
 func TestRunnerResults(t *testing.T) {
 	runner := testRunner(echoInfer)
 	runner.Run(context.Background(), protocol.EvalRun{Suite: "math"})
@@ -240,6 +310,21 @@ func TestRunnerResults(t *testing.T) {
 	}
 }
 
+func TestRunnerResultsBySuiteInterleaved(t *testing.T) {
+	runner := testRunner(echoInfer)
+	runner.Run(context.Background(), protocol.EvalRun{Suite: "math", Tasks: []string{"add"}})
+	runner.Run(context.Background(), protocol.EvalRun{Suite: "contains"})
+	runner.Run(context.Background(), protocol.EvalRun{Suite: "math", Tasks: []string{"mul"}})
+
+	math := runner.ResultsBySuite("math")
+	if len(math) != 2 || math[0].Task != "add" || math[1].Task != "mul" {
+		t.Errorf("math results = %+v, want [add mul]", math)
+	}
+	if got := runner.ResultsBySuite("nonexistent"); len(got) != 0 {
+		t.Errorf("nonexistent results = %d, want 0", len(got))
+	}
+}
+
 // --- Handler tests ---
 
 func testRunnerAndRegistry() (*Runner, *SuiteRegistry) {
@@ -295,6 +380,20 @@ func TestHandlerIngestWrongType(t *testing.T) {
 	}
 }
 
+func TestHandlerIngestBodyTooLarge(t *testing.T) {
+	runner, reg := testRunnerAndRegistry()
+	h := NewHandler(runner, reg)
+
+	body := `{"type":"eval.run","payload":"` + strings.Repeat("x", maxBodyBytes) + `"}`
+	req := httptest.NewRequest("POST", "/mist", strings.NewReader(body))
+	w := httptest.NewRecorder()
+	h.Ingest(w, req)
+
+	if w.Code != http.StatusRequestEntityTooLarge {
+		t.Errorf("status = %d, want 413", w.Code)
+	}
+}
+
 func TestHandlerRunDirect(t *testing.T) {
 	runner, reg := testRunnerAndRegistry()
 	h := NewHandler(runner, reg)
@@ -309,6 +408,37 @@ func TestHandlerRunDirect(t *testing.T) {
 	}
 }
 
+func TestHandlerRunDirectBodyTooLarge(t *testing.T) {
+	runner, reg := testRunnerAndRegistry()
+	h := NewHandler(runner, reg)
+
+	body := `{"suite":"` + strings.Repeat("x", maxBodyBytes) + `"}`
+	req := httptest.NewRequest("POST", "/eval", strings.NewReader(body))
+	w := httptest.NewRecorder()
+	h.RunDirect(w, req)
+
+	if w.Code != http.StatusRequestEntityTooLarge {
+		t.Errorf("status = %d, want 413", w.Code)
+	}
+}
+
+func TestHandlerRunDirectNoMatchingTasks(t *testing.T) {
+	runner, reg := testRunnerAndRegistry()
+	h := NewHandler(runner, reg)
+
+	body, _ := json.Marshal(protocol.EvalRun{Suite: "math", Tasks: []string{"missing"}})
+	req := httptest.NewRequest("POST", "/eval", bytes.NewReader(body))
+	w := httptest.NewRecorder()
+	h.RunDirect(w, req)
+
+	if w.Code != http.StatusOK {
+		t.Fatalf("status = %d, want 200", w.Code)
+	}
+	if got := strings.TrimSpace(w.Body.String()); got != "null" {
+		t.Errorf("body = %s, want null", got)
+	}
+}
+
 func TestHandlerSuites(t *testing.T) {
 	runner, reg := testRunnerAndRegistry()
 	h := NewHandler(runner, reg)
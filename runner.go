@@ -21,8 +21,13 @@ type Runner struct {
 	infer    InferFunc
 	reporter *tokentrace.Reporter
 
+	// concurrency bounds how many tasks of a suite run at once.
+	// Values below 2 run tasks sequentially.
+	concurrency int
+
 	mu      sync.Mutex
 	results []protocol.EvalResult
+	bySuite map[string][]int // suite name -> indices into results
 }
 
 // NewRunner creates a runner with the given suite registry and inference function.
@@ -31,9 +36,18 @@ func NewRunner(registry *SuiteRegistry, infer InferFunc, reporter *tokentrace.Re
 		registry: registry,
 		infer:    infer,
 		reporter: reporter,
+		bySuite:  make(map[string][]int),
 	}
 }
 
+// SetConcurrency sets how many tasks of a suite may run at once. With n > 1
+// the inference function is called from multiple goroutines and must be safe
+// for concurrent use. Results are always returned in suite order. Call it
+// before the runner is shared.
+func (r *Runner) SetConcurrency(n int) {
+	r.concurrency = n
+}
+
 // Run executes all tasks in the named suite and returns the results.
 func (r *Runner) Run(ctx context.Context, run protocol.EvalRun) ([]protocol.EvalResult, error) {
 	suite, ok := r.registry.Get(run.Suite)
@@ -44,17 +58,15 @@ func (r *Runner) Run(ctx context.Context, run protocol.EvalRun) ([]protocol.Eval
 	ctx, span := trace.Start(ctx, "matchspec.eval")
 	span.SetAttr("suite", run.Suite)
 
-	var results []protocol.EvalResult
-	var passed, failed int
-
 	tasks := suite.Tasks
 	if len(run.Tasks) > 0 {
 		tasks = filterTasks(suite.Tasks, run.Tasks)
 	}
 
-	for _, task := range tasks {
-		result := r.runTask(ctx, suite.Name, task)
-		results = append(results, result)
+	results := r.runTasks(ctx, suite.Name, tasks)
+
+	var passed, failed int
+	for _, result := range results {
 		if result.Passed {
 			passed++
 		} else {
@@ -73,12 +85,44 @@ func (r *Runner) Run(ctx context.Context, run protocol.EvalRun) ([]protocol.Eval
 	r.reporter.Report(ctx, span)
 
 	r.mu.Lock()
-	r.results = append(r.results, results...)
+	for _, res := range results {
+		r.bySuite[res.Suite] = append(r.bySuite[res.Suite], len(r.results))
+		r.results = append(r.results, res)
+	}
 	r.mu.Unlock()
 
 	return results, nil
 }
 
+// runTasks runs tasks, at most r.concurrency at a time, and returns their
+// results in task order.
+func (r *Runner) runTasks(ctx context.Context, suite string, tasks []Task) []protocol.EvalResult {
+	if len(tasks) == 0 {
+		return nil
+	}
+	results := make([]protocol.EvalResult, len(tasks))
+	if r.concurrency < 2 || len(tasks) < 2 {
+		for i, task := range tasks {
+			results[i] = r.runTask(ctx, suite, task)
+		}
+		return results
+	}
+
+	sem := make(chan struct{}, r.concurrency)
+	var wg sync.WaitGroup
+	for i, task := range tasks {
+		sem <- struct{}{}
+		wg.Add(1)
+		go func(i int, task Task) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			results[i] = r.runTask(ctx, suite, task)
+		}(i, task)
+	}
+	wg.Wait()
+	return results
+}
+
 func (r *Runner) runTask(ctx context.Context, suite string, task Task) protocol.EvalResult {
 	ctx, span := trace.Start(ctx, "matchspec.task")
 	span.SetAttr("suite", suite)
@@ -135,25 +179,30 @@ func (r *Runner) Results() []protocol.EvalResult {
 func (r *Runner) ResultsBySuite(suite string) []protocol.EvalResult {
 	r.mu.Lock()
 	defer r.mu.Unlock()
-	var filtered []protocol.EvalResult
-	for _, res := range r.results {
-		if res.Suite == suite {
-			filtered = append(filtered, res)
-		}
+	idx := r.bySuite[suite]
+	if len(idx) == 0 {
+		return nil
+	}
+	filtered := make([]protocol.EvalResult, len(idx))
+	for i, j := range idx {
+		filtered[i] = r.results[j]
 	}
 	return filtered
 }
 
 func filterTasks(all []Task, names []string) []Task {
-	nameSet := make(map[string]bool, len(names))
+	nameSet := make(map[string]struct{}, len(names))
 	for _, n := range names {
-		nameSet[n] = true
+		nameSet[n] = struct{}{}
 	}
-	var filtered []Task
+	filtered := make([]Task, 0, min(len(names), len(all)))
 	for _, t := range all {
-		if nameSet[t.Name] {
+		if _, ok := nameSet[t.Name]; ok {
 			filtered = append(filtered, t)
 		}
 	}
+	if len(filtered) == 0 {
+		return nil
+	}
 	return filtered
 }
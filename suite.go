@@ -101,6 +101,13 @@ func (r *SuiteRegistry) Get(name string) (*Suite, bool) {
 	return s, ok
 }
 
+// Each calls fn for every registered suite, in no particular order.
+func (r *SuiteRegistry) Each(fn func(*Suite)) {
+	for _, s := range r.suites {
+		fn(s)
+	}
+}
+
 // Names returns all registered suite names.
 func (r *SuiteRegistry) Names() []string {
 	names := make([]string, 0, len(r.suites))